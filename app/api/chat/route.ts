@@ -78,14 +78,14 @@ interface CortexCompleteResponse {
 export async function POST(request: Request) {
   try {
     const body = await request.json();
-    const { message, modelId, selectedOptions, modelInfo } = body;
+    const { message, modelId, selectedOptions, modelInfo, sessionId } = body;
     
     // Proxy to Python backend which has the correct SQL-based optimization
     const backendUrl = process.env.BACKEND_URL || 'http://127.0.0.1:8000';
     const backendResponse = await fetch(`${backendUrl}/api/chat`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ message, modelId, selectedOptions, modelInfo })
+      body: JSON.stringify({ message, modelId, selectedOptions, modelInfo, sessionId })
     });
     
     if (backendResponse.ok) {
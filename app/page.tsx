@@ -47,11 +47,14 @@ export type SavedConfig = {
   TOTAL_COST_USD: number;
   TOTAL_WEIGHT_LBS: number;
   PERFORMANCE_SUMMARY: Record<string, number>;
-  CONFIG_OPTIONS: string[];
+  CONFIG_OPTIONS?: string[]; // absent in view=summary listings, see fetchFullConfig
+  OPTION_COUNT?: number;
   NOTES: string;
   IS_VALIDATED?: boolean;
 };
 
+const CONFIG_PAGE_SIZE = 50;
+
 type Page = "models" | "configurator" | "compare";
 
 export default function Home() {
@@ -61,6 +64,7 @@ export default function Home() {
   const [selectedOptions, setSelectedOptions] = useState<string[]>([]);
   const [allOptions, setAllOptions] = useState<BOMOption[]>([]);
   const [savedConfigs, setSavedConfigs] = useState<SavedConfig[]>([]);
+  const [configsCursor, setConfigsCursor] = useState<string | null>(null);
   const [loadedConfigName, setLoadedConfigName] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [pendingLoadedConfig, setPendingLoadedConfig] = useState<SavedConfig | null>(null);
@@ -117,19 +121,37 @@ export default function Home() {
     }
   }
 
+  async function fetchConfigsPage(cursor: string | null) {
+    const params = new URLSearchParams({ view: "summary", limit: String(CONFIG_PAGE_SIZE) });
+    if (cursor) params.set("cursor", cursor);
+    const res = await fetch(`/api/configs?${params}`);
+    const data = await res.json();
+    if (!Array.isArray(data)) {
+      throw new Error(`Configs API returned non-array: ${JSON.stringify(data)}`);
+    }
+    return { configs: data as SavedConfig[], nextCursor: res.headers.get("X-Next-Cursor") };
+  }
+
   async function loadSavedConfigs() {
     try {
-      const res = await fetch("/api/configs");
-      const data = await res.json();
-      if (Array.isArray(data)) {
-        setSavedConfigs(data);
-      } else {
-        console.error("Configs API returned non-array:", data);
-        setSavedConfigs([]);
-      }
+      const { configs, nextCursor } = await fetchConfigsPage(null);
+      setSavedConfigs(configs);
+      setConfigsCursor(nextCursor);
     } catch (err) {
       console.error("Error loading configs:", err);
       setSavedConfigs([]);
+      setConfigsCursor(null);
+    }
+  }
+
+  async function loadMoreSavedConfigs() {
+    if (!configsCursor) return;
+    try {
+      const { configs, nextCursor } = await fetchConfigsPage(configsCursor);
+      setSavedConfigs(prev => [...prev, ...configs]);
+      setConfigsCursor(nextCursor);
+    } catch (err) {
+      console.error("Error loading more configs:", err);
     }
   }
 
@@ -229,9 +251,16 @@ export default function Home() {
           <Compare 
             savedConfigs={savedConfigs}
             models={models}
-            onLoadConfig={(config) => {
-              const model = models.find(m => m.MODEL_ID === config.MODEL_ID);
+            onLoadConfig={async (summary) => {
+              const model = models.find(m => m.MODEL_ID === summary.MODEL_ID);
               if (model) {
+                let config: SavedConfig;
+                try {
+                  config = await fetchFullConfig(summary);
+                } catch (err) {
+                  console.error("Error loading config:", err);
+                  return;
+                }
                 setLoadedConfigName(config.CONFIG_NAME);
                 // Set options immediately before navigating
                 setSelectedOptions(config.CONFIG_OPTIONS || []);
@@ -240,6 +269,8 @@ export default function Home() {
                 setPage("configurator");
               }
             }}
+            hasMoreConfigs={configsCursor !== null}
+            onLoadMoreConfigs={loadMoreSavedConfigs}
             onUpdateConfig={loadSavedConfigs}
           />
         )}
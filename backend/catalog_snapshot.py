@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Versioned catalog snapshot: models, model options (with SPECS and defaults) and
+validation rules as uncompressed Arrow IPC files, so the backend can memory-map them.
+
+A snapshot is a directory:
+    manifest.json   format, content version, build time, source and row counts
+    models.arrow    MODEL_TBL
+    options.arrow   TRUCK_OPTIONS joined to BOM_TBL, one row per (model, option)
+    rules.arrow     VALIDATION_RULES
+
+Built before the image (setup.sh step 10) and copied in with backend/:
+    python backend/catalog_snapshot.py --connection NAME --database BOM --schema BOM4
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import pyarrow as pa
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_TABLES = ("models", "options", "rules")
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog_snapshot")
+
+# table -> SELECT, with the same columns and order load_model_catalog and the rule cache use
+SNAPSHOT_QUERIES = {
+    "models": "SELECT * FROM {db}.{schema}.MODEL_TBL ORDER BY MODEL_ID",
+    "options": """
+        SELECT t.MODEL_ID, b.OPTION_ID, b.OPTION_NM, b.SYSTEM_NM, b.SUBSYSTEM_NM, b.COMPONENT_GROUP,
+               b.COST_USD, b.WEIGHT_LBS, b.PERFORMANCE_CATEGORY, b.PERFORMANCE_SCORE,
+               b.DESCRIPTION, b.SPECS::VARCHAR AS SPECS, t.IS_DEFAULT
+        FROM {db}.{schema}.TRUCK_OPTIONS t
+        JOIN {db}.{schema}.BOM_TBL b ON t.OPTION_ID = b.OPTION_ID
+        ORDER BY t.MODEL_ID, b.SYSTEM_NM, b.SUBSYSTEM_NM, b.COMPONENT_GROUP, b.COST_USD
+    """,
+    "rules": """
+        SELECT RULE_ID, DOC_ID, DOC_TITLE, LINKED_OPTION_ID, COMPONENT_GROUP,
+               SPEC_NAME, MIN_VALUE, MAX_VALUE, UNIT, RAW_REQUIREMENT
+        FROM {db}.{schema}.VALIDATION_RULES
+        ORDER BY RULE_ID
+    """,
+}
+
+
+def normalize_table(table: pa.Table) -> pa.Table:
+    """One contiguous chunk per column with stable integer widths, so identical data hashes identically"""
+    schema = pa.schema([
+        field.with_type(pa.int64()) if pa.types.is_integer(field.type) else field
+        for field in table.schema
+    ])
+    return table.cast(schema).combine_chunks()
+
+
+def write_snapshot(path: str, tables: Dict[str, pa.Table], source: str) -> Dict[str, Any]:
+    """Write the tables and a manifest into path; the directory is replaced atomically"""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp_path, exist_ok=True)
+    digest = hashlib.sha256()
+    counts = {}
+    for name in SNAPSHOT_TABLES:
+        table = normalize_table(tables[name])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        data = sink.getvalue()
+        digest.update(name.encode("utf-8"))
+        digest.update(data)
+        with open(os.path.join(tmp_path, f"{name}.arrow"), "wb") as f:
+            f.write(data)
+        counts[name] = table.num_rows
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": digest.hexdigest()[:16],
+        "builtAt": datetime.now(timezone.utc).isoformat(),
+        "source": source,
+        "rows": counts,
+    }
+    with open(os.path.join(tmp_path, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    if os.path.isdir(path):
+        old_path = f"{path}.old-{os.getpid()}"
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        for name in os.listdir(old_path):
+            os.remove(os.path.join(old_path, name))
+        os.rmdir(old_path)
+    else:
+        os.replace(tmp_path, path)
+    return manifest
+
+
+def open_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """Memory-map a snapshot directory. Returns {"manifest", "models", "options", "rules"}, or None when absent.
+
+    Tables are zero-copy views over the mapped files, so the pages are shared through the
+    OS page cache by every worker process that opens the same snapshot.
+    """
+    manifest_path = os.path.join(path, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported catalog snapshot format {manifest.get('format')} (expected {SNAPSHOT_FORMAT})")
+    snapshot = {"manifest": manifest}
+    for name in SNAPSHOT_TABLES:
+        source = pa.memory_map(os.path.join(path, f"{name}.arrow"), "r")
+        snapshot[name] = pa.ipc.open_file(source).read_all()
+    return snapshot
+
+
+def build_from_snowflake(args) -> Dict[str, Any]:
+    import snowflake.connector
+
+    conn = snowflake.connector.connect(connection_name=args.connection)
+    try:
+        tables = {}
+        for name in SNAPSHOT_TABLES:
+            started = time.time()
+            cursor = conn.cursor()
+            cursor.execute(SNAPSHOT_QUERIES[name].format(db=args.database, schema=args.schema))
+            tables[name] = cursor.fetch_arrow_all(force_return_table=True)
+            cursor.close()
+            print(f"  {name:<8} {tables[name].num_rows:>9,} rows  {time.time() - started:.2f}s")
+    finally:
+        conn.close()
+    return write_snapshot(args.output, tables, f"{args.database}.{args.schema}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the catalog snapshot the backend memory-maps at startup")
+    parser.add_argument("--connection", default=os.getenv("SNOWFLAKE_CONNECTION_NAME"),
+                        help="Snowflake CLI connection name (default: $SNOWFLAKE_CONNECTION_NAME)")
+    parser.add_argument("--database", default=os.getenv("SNOWFLAKE_DATABASE", "BOM"))
+    parser.add_argument("--schema", default=os.getenv("SNOWFLAKE_SCHEMA", "BOM4"))
+    parser.add_argument("--output", default=DEFAULT_SNAPSHOT_DIR)
+    args = parser.parse_args()
+    if not args.connection:
+        parser.error("--connection or SNOWFLAKE_CONNECTION_NAME is required")
+
+    started = time.time()
+    print(f"Building catalog snapshot from {args.database}.{args.schema}")
+    manifest = build_from_snowflake(args)
+    print(f"Snapshot {manifest['version']} written to {args.output} in {time.time() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+# (OPTION_ID, SYSTEM_NM, SUBSYSTEM_NM, COMPONENT_GROUP, OPTION_NM, COST_USD, WEIGHT_LBS,
+#  PERFORMANCE_CATEGORY, PERFORMANCE_SCORE, IS_DEFAULT, SPECS)
+OPTIONS = [
+    ("1", "Cab", "Cab Structure", "Cab Type", "Day Cab", 0, 1200, "Comfort", 1, True, {}),
+    ("2", "Cab", "Cab Structure", "Cab Type", "Sleeper", 6500, 1800, "Comfort", 3, False, {}),
+    ("10", "Engine", "Turbo", "Turbocharger", "Single Turbo", 0, 100, "Power", 2, True, {"boost_psi": 35}),
+    ("11", "Engine", "Turbo", "Turbocharger", "Twin Turbo", 4000, 130, "Power", 5, False, {"boost_psi": 48}),
+    ("20", "Engine", "Core", "Engine", "13L", 0, 2500, "Power", 3, True, {}),
+    ("21", "Engine", "Core", "Engine", "15L 605HP", 9000, 2900, "Power", 5, False, {}),
+]
+
+# The 605HP engine needs at least 45 PSI of boost
+RULE = {"RULE_ID": "r1", "DOC_ID": "D1", "DOC_TITLE": "605 spec", "LINKED_OPTION_ID": "21",
+        "COMPONENT_GROUP": "Turbocharger", "SPEC_NAME": "boost_psi", "MIN_VALUE": 45, "MAX_VALUE": None,
+        "UNIT": "PSI", "RAW_REQUIREMENT": "minimum 45 PSI boost"}
+
+
+@pytest.fixture
+def catalog():
+    rows = [
+        dict(MODEL_ID="M1", MODEL_NM="Model", BASE_MSRP=100000, BASE_WEIGHT_LBS=15000,
+             OPTION_ID=o[0], SYSTEM_NM=o[1], SUBSYSTEM_NM=o[2], COMPONENT_GROUP=o[3], OPTION_NM=o[4],
+             COST_USD=o[5], WEIGHT_LBS=o[6], PERFORMANCE_CATEGORY=o[7], PERFORMANCE_SCORE=o[8],
+             IS_DEFAULT=o[9], DESCRIPTION="", SPECS=json.dumps(o[10]))
+        for o in OPTIONS
+    ]
+    return main.build_model_catalog(rows, "warehouse")
+
+
+@pytest.fixture
+def rules_by_option():
+    return {"21": [RULE]}
+
+
+@pytest.fixture
+def fake_query(monkeypatch):
+    """Replace main.query with a stub returning canned rows; records the SQL it was given"""
+    calls = {"sql": [], "rows": []}
+
+    def query(sql):
+        calls["sql"].append(sql)
+        return calls["rows"]
+
+    monkeypatch.setattr(main, "query", query)
+    return calls
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(main, "AI_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(main, "AI_SESSION_CONCURRENCY", 1)
+    monkeypatch.setattr(main, "AI_MAX_QUEUE", 8)
+    monkeypatch.setattr(main, "AI_QUEUE_TIMEOUT_SECONDS", 5)
+    return main.AIScheduler()
+
+
+def queue_waiter(scheduler, call_class, session, admitted):
+    """Acquire in a thread, recording the admission order, and wait until the call is queued"""
+    queued = len(scheduler.waiting)
+
+    def run():
+        ticket = scheduler.acquire(call_class, session)
+        admitted.append(call_class if session == "s" else session)
+        scheduler.release(ticket)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    deadline = time.time() + 5
+    while len(scheduler.waiting) == queued:
+        assert time.time() < deadline
+        time.sleep(0.001)
+    return thread
+
+
+def test_chat_overtakes_queued_extraction(scheduler):
+    held = scheduler.acquire("extraction", "worker")
+    admitted = []
+    threads = [queue_waiter(scheduler, "extraction", "s", admitted), queue_waiter(scheduler, "chat", "s", admitted)]
+    scheduler.release(held)
+    for thread in threads:
+        thread.join(5)
+    assert admitted == ["chat", "extraction"]
+
+
+def test_busy_session_does_not_block_others(scheduler, monkeypatch):
+    monkeypatch.setattr(main, "AI_MAX_CONCURRENCY", 2)
+    held = scheduler.acquire("chat", "a")
+    admitted = []
+    # A global slot is free, but session a is at its own limit and has to wait
+    second_a = queue_waiter(scheduler, "chat", "a", admitted)
+    other = scheduler.acquire("chat", "b")
+    assert admitted == []
+    scheduler.release(other)
+    scheduler.release(held)
+    second_a.join(5)
+    assert admitted == ["a"]
+
+
+def test_fewer_in_flight_sessions_go_first(scheduler, monkeypatch):
+    monkeypatch.setattr(main, "AI_SESSION_CONCURRENCY", 2)
+    monkeypatch.setattr(main, "AI_MAX_CONCURRENCY", 2)
+    held_a = scheduler.acquire("chat", "a")
+    held_b = scheduler.acquire("chat", "b")
+    admitted = []
+    threads = [queue_waiter(scheduler, "chat", "a", admitted), queue_waiter(scheduler, "chat", "c", admitted)]
+    # Freeing b's slot leaves a with one call in flight and c with none
+    scheduler.release(held_b)
+    threads[1].join(5)
+    scheduler.release(held_a)
+    threads[0].join(5)
+    assert admitted == ["c", "a"]
+
+
+def test_interactive_calls_are_shed_when_the_queue_is_full(scheduler, monkeypatch):
+    monkeypatch.setattr(main, "AI_MAX_QUEUE", 1)
+    held = scheduler.acquire("chat", "a")
+    admitted = []
+    waiter = queue_waiter(scheduler, "chat", "b", admitted)
+    with pytest.raises(main.AIOverloaded) as err:
+        scheduler.acquire("chat", "c")
+    assert err.value.status_code == 429
+    assert int(err.value.headers["Retry-After"]) >= 1
+    # Background work still queues
+    background = queue_waiter(scheduler, "extraction", "s", admitted)
+    scheduler.release(held)
+    waiter.join(5), background.join(5)
+    assert scheduler.status()["classes"]["chat"]["shed"] == 1
+    assert admitted == ["b", "extraction"]
+
+
+def test_interactive_wait_times_out(scheduler, monkeypatch):
+    monkeypatch.setattr(main, "AI_QUEUE_TIMEOUT_SECONDS", 0.05)
+    held = scheduler.acquire("chat", "a")
+    with pytest.raises(main.AIOverloaded):
+        scheduler.acquire("chat", "b")
+    assert scheduler.waiting == []
+    assert scheduler.status()["classes"]["chat"]["timedOut"] == 1
+    scheduler.release(held)
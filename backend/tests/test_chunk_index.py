@@ -0,0 +1,49 @@
+import pytest
+
+import main
+
+
+def chunk_row(doc_id, index, text):
+    return {"DOC_ID": doc_id, "DOC_TITLE": f"{doc_id} spec", "CHUNK_INDEX": index, "CHUNK_TEXT": text}
+
+
+def test_load_keeps_documents_changed_during_the_read():
+    index = main.ChunkIndex()
+
+    def fetch_rows():
+        # Ingestion and delete land while the warehouse read is in flight
+        index.add_document("DOC-NEW", "New spec", ["turbocharger boost pressure"])
+        index.remove_document("DOC-GONE")
+        return [chunk_row("DOC-OLD", 0, "axle load rating"), chunk_row("DOC-GONE", 0, "retarder torque"),
+                chunk_row("DOC-NEW", 0, "stale text read before the upload")]
+
+    assert index.load(fetch_rows) == 2
+    assert index.ready
+    assert [r["DOC_ID"] for r in index.search("turbocharger boost")] == ["DOC-NEW"]
+    assert index.search("retarder") == []
+    assert index.search("stale") == []
+    assert [r["DOC_ID"] for r in index.search("axle")] == ["DOC-OLD"]
+
+
+def test_reload_replaces_unchanged_documents():
+    index = main.ChunkIndex()
+    index.load(lambda: [chunk_row("DOC-1", 0, "axle load"), chunk_row("DOC-2", 0, "brake drum")])
+    index.load(lambda: [chunk_row("DOC-1", 0, "axle rating")])
+    assert index.search("brake") == []
+    assert index.search("load") == []
+    assert len(index.chunks) == 1
+    assert index.total_length == index.chunks[("DOC-1", 0)]["length"]
+
+
+def test_load_chunk_index_failure_propagates(monkeypatch):
+    index = main.ChunkIndex()
+    monkeypatch.setattr(main, "_chunk_index", index)
+
+    def query(sql):
+        raise RuntimeError("warehouse unavailable")
+
+    monkeypatch.setattr(main, "query", query)
+    with pytest.raises(RuntimeError):
+        main.load_chunk_index()
+    assert not index.ready
+    assert not index.loading
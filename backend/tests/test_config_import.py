@@ -0,0 +1,42 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def import_catalog(monkeypatch, catalog):
+    monkeypatch.setattr(main, "get_model_catalog", lambda model_id: catalog if model_id == "M1" else None)
+    return catalog
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("21;11", ["21", "11"]),
+    (" 21 | 11 ", ["21", "11"]),
+    ('["21", 11]', ["21", "11"]),
+    (["21", 11], ["21", "11"]),
+    (21, ["21"]),
+    ("", []),
+    (None, []),
+])
+def test_import_option_ids(value, expected):
+    assert main.import_option_ids(value) == expected
+
+
+def test_ndjson_string_options_are_split(import_catalog, rules_by_option):
+    [raw] = main.parse_import_rows(b'{"configName": "A", "modelId": "M1", "selectedOptions": "21;11"}', "a.ndjson", None)
+    row = main.prepare_import_row(raw, rules_by_option)
+    assert row["errors"] == []
+    assert row["selections"]["selectedOptions"] == ["21", "11", "1"]
+    assert row["warnings"] == []
+
+
+def test_linked_rules_flag_the_default_turbo(import_catalog, rules_by_option):
+    row = main.prepare_import_row({"configName": "B", "modelId": "M1", "selectedOptions": ["21"]}, rules_by_option)
+    # The 605HP engine needs 45 PSI; the default single turbo only makes 35
+    assert row["warnings"] and row["warnings"][0].startswith("Single Turbo:")
+    assert row["selections"]["isValidated"] is False
+
+
+def test_conflicting_picks_in_one_group(import_catalog, rules_by_option):
+    row = main.prepare_import_row({"configName": "C", "modelId": "M1", "selectedOptions": "10;11"}, rules_by_option)
+    assert row["errors"] == ["Multiple options selected for Turbocharger: 10, 11"]
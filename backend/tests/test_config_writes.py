@@ -0,0 +1,114 @@
+import json
+import threading
+from datetime import timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from snowflake.connector.errors import ProgrammingError
+
+import main
+
+
+@pytest.fixture
+def warehouse(monkeypatch):
+    """Stub main.query for MERGEs: rows containing BAD are rejected as too long, and while
+    down is set every statement fails the way a suspended warehouse does"""
+    state = {"down": False, "merged": []}
+
+    def query(sql):
+        if state["down"]:
+            raise ProgrammingError(msg="No active warehouse selected in the current session", errno=606)
+        if "BAD" in sql:
+            raise ProgrammingError(msg="String 'BAD...' is too long and would be truncated", errno=100078)
+        state["merged"].append(sql)
+        return []
+
+    monkeypatch.setattr(main, "query", query)
+    return state
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CONFIG_WRITE_BEHIND", True)
+    queue = main.ConfigWriteQueue(str(tmp_path / "journal.ndjson"))
+    # Stands in for the background flusher so enqueue() only journals
+    queue.thread = threading.Thread(target=lambda: None)
+    return queue
+
+
+def save(queue, config_id):
+    queue.enqueue({"op": "upsert", "configId": config_id, "configName": config_id, "modelId": "M1",
+                   "selections": {"selectedOptions": ["1"]}, "totalCost": 1, "totalWeight": 1, "notes": ""})
+
+
+def journal_ids(path):
+    with open(path) as f:
+        return [json.loads(line)["configId"] for line in f]
+
+
+def dead_letter_ids(path):
+    with open(path) as f:
+        return [json.loads(line)["op"]["configId"] for line in f]
+
+
+def test_flush_dead_letters_rows_the_warehouse_rejects(queue, warehouse):
+    for config_id in ("CFG-1", "CFG-BAD", "CFG-2"):
+        save(queue, config_id)
+
+    assert queue.flush() == 2
+    assert queue.pending == {} and queue.inflight == {}
+    assert [d["op"]["configId"] for d in queue.dead_letters] == ["CFG-BAD"]
+    assert dead_letter_ids(queue.dead_letter_path) == ["CFG-BAD"]
+    assert journal_ids(queue.journal_path) == []
+    assert queue.status()["deadLettered"] == 1
+    assert queue.status()["consecutiveFailures"] == 0
+
+
+def test_flush_keeps_rows_when_the_failure_is_not_about_them(queue, warehouse):
+    for config_id in ("CFG-1", "CFG-2"):
+        save(queue, config_id)
+    warehouse["down"] = True
+
+    assert queue.flush() == 0
+    assert sorted(queue.pending) == ["CFG-1", "CFG-2"]
+    assert queue.dead_letters == []
+    assert sorted(journal_ids(queue.journal_path)) == ["CFG-1", "CFG-2"]
+    assert queue.status()["consecutiveFailures"] == 1
+
+    # A restart replays the journal; once the warehouse is back everything merges
+    restarted = main.ConfigWriteQueue(queue.journal_path)
+    assert restarted.replay_journal() == 2
+    warehouse["down"] = False
+    assert restarted.flush() == 2
+    assert restarted.pending == {} and journal_ids(restarted.journal_path) == []
+
+
+def test_pending_saves_overlay_listings(queue, warehouse):
+    save(queue, "CFG-1")
+    queue.enqueue({"op": "update", "configId": "CFG-1", "configName": "renamed", "notes": "n"})
+
+    listed = queue.overlay_list([], False, True, lambda config: True)
+    assert [(c["CONFIG_ID"], c["CONFIG_NAME"], c["PENDING"]) for c in listed] == [("CFG-1", "renamed", True)]
+    assert queue.overlay_list([], False, False, lambda config: True) == []
+
+    queue.enqueue({"op": "delete", "configId": "CFG-1"})
+    assert queue.overlay_one("CFG-1", {"CONFIG_ID": "CFG-1"}) is None
+
+
+def test_pending_saves_filter_by_time_like_stored_rows(queue, warehouse, monkeypatch):
+    monkeypatch.setattr(main, "_config_writes", queue)
+    save(queue, "CFG-1")
+    created = main.parse_utc_timestamp(queue.pending["CFG-1"]["enqueuedAt"])
+    assert abs((created - main.utc_now()).total_seconds()) < 60
+
+    client = TestClient(main.app)
+    hour_ago = main.utc_now() - timedelta(hours=1)
+    # The same instant written with a +05:00 offset
+    hour_ago_plus5 = (hour_ago.replace(tzinfo=timezone.utc)).astimezone(timezone(timedelta(hours=5))).isoformat()
+
+    def listed(**params):
+        return [c["CONFIG_ID"] for c in client.get("/api/configs", params=params).json()]
+
+    assert listed(createdAfter=hour_ago.isoformat()) == ["CFG-1"]
+    assert listed(createdAfter=hour_ago_plus5) == ["CFG-1"]
+    assert listed(createdBefore=hour_ago_plus5) == []
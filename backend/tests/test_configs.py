@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+def test_config_cursor_round_trip():
+    cursor = main.encode_config_cursor(datetime(2026, 1, 2, 3, 4, 5), "CFG-1")
+    assert main.decode_config_cursor(cursor) == ("2026-01-02T03:04:05", "CFG-1")
+    # Timestamps that arrive as strings are kept as they are
+    assert main.decode_config_cursor(main.encode_config_cursor("2026-01-02T03:04:05", "CFG-2")) == \
+        ("2026-01-02T03:04:05", "CFG-2")
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", main.encode_config_cursor("yesterday", "CFG-1"), "WzFd"])
+def test_decode_config_cursor_rejects_garbage(cursor):
+    with pytest.raises(HTTPException) as err:
+        main.decode_config_cursor(cursor)
+    assert err.value.status_code == 400
+
+
+def test_parse_variant():
+    assert main.parse_variant('{"a": [1, 2]}', None) == {"a": [1, 2]}
+    assert main.parse_variant("[]", None) == []
+    assert main.parse_variant(None, []) == []
+    assert main.parse_variant("{broken", {}) == {}
+    # Already-decoded values pass through
+    assert main.parse_variant({"a": 1}, None) == {"a": 1}
+
+
+def config_rows(n):
+    return [{"CONFIG_ID": f"CFG-{i:03d}", "CONFIG_NAME": f"Config {i}", "MODEL_ID": "M1", "TOTAL_COST": 1000,
+             "TOTAL_WEIGHT": 500, "NOTES": "", "CREATED_AT": datetime(2026, 1, 1, 0, 0, n - i),
+             "CONFIG_FINGERPRINT": None, "PERFORMANCE_SUMMARY": "{}", "IS_VALIDATED": False, "OPTION_COUNT": 3}
+            for i in range(n)]
+
+
+def test_list_page_sets_next_cursor(fake_query):
+    fake_query["rows"] = config_rows(3)
+    response = main.Response()
+    page = main.get_configs(response, limit=2, view="summary")
+    assert "LIMIT 3" in fake_query["sql"][0]
+    assert [c["CONFIG_ID"] for c in page] == ["CFG-000", "CFG-001"]
+    assert main.decode_config_cursor(response.headers["X-Next-Cursor"])[1] == "CFG-001"
+
+
+def test_list_default_limit_over_http(fake_query):
+    from fastapi.testclient import TestClient
+
+    fake_query["rows"] = config_rows(2)
+    # Oversized limits are capped, and a bare GET still pages with the default
+    response = TestClient(main.app).get("/api/configs", params={"limit": 10_000})
+    assert response.status_code == 200
+    assert f"LIMIT {main.CONFIG_PAGE_MAX + 1}" in fake_query["sql"][0]
+    assert "X-Next-Cursor" not in response.headers
+
+    TestClient(main.app).get("/api/configs")
+    assert f"LIMIT {main.CONFIG_PAGE_DEFAULT + 1}" in fake_query["sql"][1]
@@ -0,0 +1,79 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def chunk_table(monkeypatch):
+    """ENGINEERING_DOCS_CHUNKED stand-in: serves the stored rows and records every write"""
+    state = {"rows": [], "writes": [], "fail_inserts": False}
+
+    def query(sql):
+        statement = sql.strip()
+        if statement.startswith("SELECT"):
+            return state["rows"]
+        if statement.startswith("INSERT") and state["fail_inserts"]:
+            raise RuntimeError("warehouse unavailable")
+        state["writes"].append(statement)
+        return []
+
+    monkeypatch.setattr(main, "query", query)
+    return state
+
+
+def stored(*texts):
+    return [{"CHUNK_ID": f"C{i}", "CHUNK_INDEX": i, "CONTENT_HASH": "old", "CHUNK_HASH": main.chunk_hash(text)}
+            for i, text in enumerate(texts)]
+
+
+def test_revision_stamps_hash_after_inserting(chunk_table):
+    chunk_table["rows"] = stored("a", "b")
+    inserted, unchanged = main.apply_document_revision("DOC-1", "Spec", "@stage/spec.txt", "new", ["b", "c"])
+    assert (inserted, unchanged) == (1, 1)
+    kinds = [w.split()[0] for w in chunk_table["writes"]]
+    assert kinds == ["INSERT", "DELETE", "UPDATE", "UPDATE"]
+    assert "CONTENT_HASH = 'new'" in chunk_table["writes"][-1]
+
+
+def test_short_revision_insert_keeps_stored_revision(chunk_table):
+    chunk_table["rows"] = stored("a", "b")
+    chunk_table["fail_inserts"] = True
+    with pytest.raises(RuntimeError):
+        main.apply_document_revision("DOC-1", "Spec", "@stage/spec.txt", "new", ["b", "c"])
+    # Only the rows tagged with the new hash are removed; nothing old is deleted or restamped
+    assert len(chunk_table["writes"]) == 1
+    assert "CONTENT_HASH = 'new'" in chunk_table["writes"][0]
+    assert chunk_table["writes"][0].startswith("DELETE")
+
+
+@pytest.fixture
+def extraction(monkeypatch, chunk_table):
+    """Rule extraction with the COMPLETE map step stubbed out"""
+    outcome = {"rules": [{"componentGroup": "Turbocharger", "specName": "boost_psi", "minValue": 45,
+                          "maxValue": None, "unit": "psi", "rawRequirement": "at least 45 psi"}]}
+
+    def map_window(doc_title, text):
+        if isinstance(outcome["rules"], Exception):
+            raise outcome["rules"]
+        return outcome["rules"]
+
+    monkeypatch.setattr(main, "_extraction_cache", {})
+    monkeypatch.setattr(main, "map_extraction_window", map_window)
+    monkeypatch.setattr(main, "load_cached_map_outputs", lambda hashes: {})
+    monkeypatch.setattr(main, "store_map_outputs", lambda doc_id, windows: None)
+    monkeypatch.setattr(main, "invalidate_validation_rules", lambda: None)
+    return outcome
+
+
+def test_rule_replacement_is_one_transaction(extraction, chunk_table):
+    assert main.extract_validation_rules("DOC-1", "Spec", ["Boost must be at least 45 psi"], ["21"], replace=True) == 1
+    [block] = chunk_table["writes"]
+    assert block.startswith("BEGIN") and "ROLLBACK" in block
+    assert block.index("DELETE FROM") < block.index("INSERT INTO")
+
+
+def test_failed_extraction_keeps_existing_rules(extraction, chunk_table):
+    extraction["rules"] = RuntimeError("COMPLETE timed out")
+    with pytest.raises(RuntimeError):
+        main.extract_validation_rules("DOC-1", "Spec", ["Boost must be at least 45 psi"], ["21"], replace=True)
+    assert chunk_table["writes"] == []
@@ -0,0 +1,11 @@
+import hashlib
+
+import main
+
+
+def test_saved_config_fingerprint_matches_the_sql_backfill():
+    # The backfill casts ids to VARCHAR, so "12" sorts before "3" and numeric ids equal their strings
+    expected = hashlib.sha256(b"M1:12,3,40").hexdigest()
+    assert main.saved_config_fingerprint("M1", ["3", 12, "40", 3, "12"]) == expected
+    assert main.saved_config_fingerprint("M1", ["40", "3", "12"]) == expected
+    assert main.saved_config_fingerprint("M2", ["40", "3", "12"]) != expected
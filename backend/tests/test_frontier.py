@@ -0,0 +1,115 @@
+import itertools
+import json
+import random
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def dominates(a, b):
+    """a is at least as cheap, light and good as b, and strictly better on one of them"""
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2] and (a[0], a[1], a[2]) != (b[0], b[1], b[2])
+
+
+def all_builds(catalog):
+    groups = [[catalog["byId"][o] for o in catalog["groups"][key]] for key in sorted(catalog["groups"])]
+    for combo in itertools.product(*groups):
+        yield (sum(o["COST_USD"] for o in combo), sum(o["WEIGHT_LBS"] for o in combo),
+               sum(o["PERFORMANCE_SCORE"] for o in combo), tuple(o["OPTION_ID"] for o in combo))
+
+
+def random_catalog(groups, per_group, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for g in range(groups):
+        for i in range(per_group):
+            rows.append(dict(MODEL_ID="M2", MODEL_NM="Random", BASE_MSRP=0, BASE_WEIGHT_LBS=0,
+                             OPTION_ID=f"{g}-{i}", SYSTEM_NM="S", SUBSYSTEM_NM="s", COMPONENT_GROUP=f"G{g}",
+                             OPTION_NM=f"{g}-{i}", COST_USD=rng.randint(0, 5000), WEIGHT_LBS=rng.randint(0, 800),
+                             PERFORMANCE_CATEGORY="Power", PERFORMANCE_SCORE=rng.randint(1, 10),
+                             IS_DEFAULT=i == 0, DESCRIPTION="", SPECS=json.dumps({})))
+    return main.build_model_catalog(rows, "warehouse")
+
+
+def test_pareto_filter_drops_dominated_points():
+    points = [
+        (100, 50, 3, "a"),
+        (120, 60, 2, "dominated by a"),
+        (120, 40, 3, "lighter"),
+        (150, 70, 5, "best score"),
+        (150, 70, 4, "dominated by best score"),
+    ]
+    kept = main.pareto_filter(points)
+    assert [p[3] for p in kept] == ["a", "lighter", "best score"]
+
+
+def test_pareto_filter_keeps_equal_points_once():
+    assert main.pareto_filter([(1, 1, 1, "x"), (1, 1, 1, "y")]) == [(1, 1, 1, "x")]
+    assert main.pareto_filter([]) == []
+
+
+def test_compute_frontier_is_exactly_the_non_dominated_builds(catalog):
+    builds = list(all_builds(catalog))
+    expected = {b[:3] for b in builds if not any(dominates(o, b) for o in builds)}
+    frontier = main.compute_frontier(catalog)
+    assert {p[:3] for p in frontier} == expected
+    # Each point's picks really add up to its totals
+    for cost, weight, score, picks in frontier:
+        options = [catalog["byId"][o] for o in picks]
+        assert (cost, weight, score) == (sum(o["COST_USD"] for o in options), sum(o["WEIGHT_LBS"] for o in options),
+                                         sum(o["PERFORMANCE_SCORE"] for o in options))
+
+
+def test_compute_frontier_thins_past_max_points(monkeypatch):
+    catalog = random_catalog(groups=5, per_group=6)
+    full = main.compute_frontier(catalog)
+    monkeypatch.setattr(main, "FRONTIER_MAX_POINTS", 20)
+    thinned = main.compute_frontier(catalog)
+    assert len(full) > 20 >= len(thinned) > 0
+    assert not any(dominates(a, b) for a in thinned for b in thinned)
+    # Thinning only drops points, it never invents them
+    assert {p[:3] for p in thinned} <= {b[:3] for b in all_builds(catalog)}
+
+
+def test_sample_frontier_keeps_extremes():
+    points = sorted([(float(c), float((c * 37) % 101), float((c * 13) % 17), ()) for c in range(100)])
+    sampled = main.sample_frontier(points, 5)
+    assert len(sampled) <= 9
+    assert points[0] in sampled and points[-1] in sampled
+    assert min(points, key=lambda p: p[1]) in sampled
+    assert max(points, key=lambda p: p[2]) in sampled
+    assert main.sample_frontier(points[:3], 5) == points[:3]
+    assert main.sample_frontier(points, 0) == points
+
+
+def test_get_frontier_recomputes_on_catalog_version_change(monkeypatch, catalog):
+    monkeypatch.setattr(main, "_frontier_cache", {})
+    monkeypatch.setattr(main, "get_model_catalog", lambda model_id: catalog if model_id == "M1" else None)
+    computed = []
+    real = main.compute_frontier
+    monkeypatch.setattr(main, "compute_frontier", lambda c: computed.append(c["version"]) or real(c))
+
+    first = main.get_frontier("M1")
+    assert main.get_frontier("M1") is first
+    assert computed == [catalog["version"]]
+
+    catalog["version"] = "changed"
+    second = main.get_frontier("M1")
+    assert second is not first and second["catalogVersion"] == "changed"
+    assert computed == [first["catalogVersion"], "changed"]
+    assert main.get_frontier("nope") is None
+
+
+def test_frontier_endpoint(monkeypatch, catalog):
+    monkeypatch.setattr(main, "_frontier_cache", {})
+    monkeypatch.setattr(main, "get_model_catalog", lambda model_id: catalog if model_id == "M1" else None)
+    client = TestClient(main.app)
+
+    body = client.get("/api/models/M1/frontier", params={"sample": 2, "includeOptions": True}).json()
+    assert body["catalogVersion"] == catalog["version"]
+    assert 2 <= len(body["points"]) <= body["frontierSize"]
+    cheapest = body["points"][0]
+    assert cheapest["totalCost"] == cheapest["optionCost"] + 100000
+    assert cheapest["optionIds"] == ["1", "20", "10"]
+    assert client.get("/api/models/M9/frontier").status_code == 404
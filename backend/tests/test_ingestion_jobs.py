@@ -0,0 +1,47 @@
+import json
+from datetime import datetime
+
+import main
+
+
+def job_row(**overrides):
+    row = {
+        "JOB_ID": "JOB-1", "DOC_ID": "DOC-1", "FILENAME": "spec.pdf", "STATUS": "succeeded",
+        "LAST_EVENT": json.dumps({"step": "rules", "status": "done"}),
+        "RESULT": json.dumps({"type": "result", "success": True, "chunkCount": 3}),
+        "ERROR": None, "CREATED_AT": datetime(2026, 1, 1), "UPDATED_AT": datetime(2026, 1, 1, 0, 5),
+    }
+    row.update(overrides)
+    return row
+
+
+def test_load_persisted_job_missing(fake_query):
+    assert main.load_persisted_job("JOB-404") is None
+    assert "'JOB-404'" in fake_query["sql"][0]
+
+
+def test_load_persisted_job_finished(fake_query):
+    fake_query["rows"] = [job_row()]
+    job = main.load_persisted_job("JOB-1")
+    assert job["status"] == "succeeded"
+    assert job["result"]["chunkCount"] == 3
+    assert job["lastEvent"] == {"step": "rules", "status": "done"}
+    assert job["error"] is None
+    assert job["createdAt"] == "2026-01-01T00:00:00"
+
+
+def test_load_persisted_job_interrupted_with_null_variants(fake_query):
+    fake_query["rows"] = [job_row(STATUS="running", LAST_EVENT=None, RESULT=None, UPDATED_AT=None)]
+    job = main.load_persisted_job("JOB-1")
+    assert job["status"] == "interrupted"
+    assert job["lastEvent"] is None
+    assert job["result"]["success"] is False
+    assert job["error"] == job["result"]["error"]
+    assert job["updatedAt"] is None
+
+
+def test_load_persisted_job_unparseable_result(fake_query):
+    fake_query["rows"] = [job_row(STATUS="failed", RESULT="{truncated", ERROR="boom")]
+    job = main.load_persisted_job("JOB-1")
+    assert job["result"] is None
+    assert job["error"] == "boom"
@@ -0,0 +1,20 @@
+import main
+
+
+class FakeContentIndex:
+    def get(self, doc_id):
+        return {"docTitle": "Spec", "docPath": "@stage/spec.pdf"} if doc_id == "DOC-1" else None
+
+
+def test_view_and_download_share_one_signature(monkeypatch):
+    signed = []
+    monkeypatch.setattr(main, "_content_index", FakeContentIndex())
+    monkeypatch.setattr(main, "query_single", lambda sql: signed.append(sql) or f"https://signed/{len(signed)}")
+    cache = main.PresignedUrlCache()
+    assert cache.get("DOC-1")["url"] == "https://signed/1"
+    assert cache.get("DOC-1")["url"] == "https://signed/1"
+    assert len(signed) == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "refreshes": 0}
+    cache.invalidate("DOC-1")
+    assert cache.get("DOC-1")["url"] == "https://signed/2"
+    assert cache.get("DOC-404") is None
@@ -0,0 +1,30 @@
+import numpy as np
+
+import main
+
+
+def test_price_vectors_fill_defaults_and_flag_conflicts(catalog):
+    vectors: main.PriceVectors = catalog["priceVectors"]
+    matrix, unknown = vectors.membership([["2"], ["1", "2"], ["999"]])
+    assert unknown == [[], [], ["999"]]
+
+    filled = vectors.price(matrix, fill_defaults=True)
+    # Sleeper plus the default turbo and engine
+    assert filled["totalCost"][0] == 100000 + 6500
+    assert filled["totalWeight"][0] == 15000 + 1800 + 100 + 2500
+    assert list(filled["conflicts"]) == [False, True, False]
+
+    bare = vectors.price(matrix, fill_defaults=False)
+    assert bare["optionCost"][0] == 6500
+    assert bare["optionCost"][2] == 0
+    assert vectors.default_cost == 100000
+
+
+def test_price_vectors_quotes(catalog):
+    quotes = list(catalog["priceVectors"].quotes([{"id": "a", "optionIds": ["11", "21"]}, {"optionIds": ["x"]}]))
+    assert quotes[0]["id"] == "a"
+    assert quotes[0]["costDelta"] == 13000
+    assert quotes[0]["performanceSummary"] == {"Comfort": 1.0, "Power": 5.0}
+    assert quotes[1]["id"] == 1
+    assert quotes[1]["unknownOptions"] == ["x"]
+    assert np.isclose(quotes[1]["totalCost"], 100000)
@@ -0,0 +1,22 @@
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("warmed_up, database, snapshot, status, code", [
+    (False, "unknown", None, "starting", 503),
+    (False, "error", {"version": "v1"}, "snapshot", 200),
+    (True, "connected", {"version": "v1"}, "ready", 200),
+    (True, "error", None, "degraded", 503),
+    # After warm-up a snapshot no longer hides a failing connection
+    (True, "error", {"version": "v1"}, "degraded", 503),
+])
+def test_ready(monkeypatch, warmed_up, database, snapshot, status, code):
+    monkeypatch.setitem(main._health_state, "ready", warmed_up)
+    monkeypatch.setitem(main._health_state, "database", database)
+    monkeypatch.setattr(main, "_catalog_snapshot", snapshot)
+    response = main.Response()
+    body = main.ready(response)
+    assert body["status"] == status
+    assert response.status_code == code
+    assert body["servingSnapshot"] is (snapshot is not None)
@@ -0,0 +1,35 @@
+import json
+
+import main
+
+
+def test_load_cached_map_outputs(fake_query):
+    assert main.load_cached_map_outputs([]) == {}
+    assert fake_query["sql"] == []
+
+    rules = [{"componentGroup": "Turbocharger", "specName": "boost_psi", "minValue": 45}]
+    fake_query["rows"] = [
+        {"HASH": "h1", "RULES": json.dumps(rules)},
+        {"HASH": "h2", "RULES": None},
+        {"HASH": "h3", "RULES": "not json"},
+        {"HASH": "h4", "RULES": "null"},
+    ]
+    outputs = main.load_cached_map_outputs(["h1", "h2", "h3", "h4", "h'5"])
+    assert outputs == {"h1": rules, "h2": [], "h3": [], "h4": []}
+    assert "'h''5'" in fake_query["sql"][0]
+
+
+def test_merge_extracted_rules_keeps_the_strictest_bounds():
+    rule = {"componentGroup": "Turbocharger", "specName": "boost_psi", "unit": "PSI", "rawRequirement": "min 40"}
+    rules, conflicts = main.merge_extracted_rules([
+        [{**rule, "minValue": 40, "maxValue": None}],
+        [{**rule, "minValue": 45, "maxValue": 60, "rawRequirement": "min 45"}],
+        [{**rule, "minValue": None, "maxValue": 55}],
+    ])
+    assert rules == [{**rule, "minValue": 45, "maxValue": 55, "rawRequirement": "min 45"}]
+    assert conflicts == []
+
+    rules, conflicts = main.merge_extracted_rules([[{**rule, "minValue": 50, "maxValue": None}],
+                                                   [{**rule, "minValue": None, "maxValue": 40}]])
+    assert rules[0]["minValue"] == 50 and rules[0]["maxValue"] is None
+    assert conflicts == [{"componentGroup": "Turbocharger", "specName": "boost_psi", "minValue": 50, "maxValue": 40}]
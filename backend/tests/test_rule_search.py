@@ -0,0 +1,54 @@
+import main
+
+
+def test_solve_linked_rules_respects_rules(catalog, rules_by_option):
+    domains = {key: [catalog["byId"][o] for o in ids] for key, ids in catalog["groups"].items()}
+    # Prefer the 605HP engine and the cheapest of everything else
+    def loss(key, opt):
+        if opt["COMPONENT_GROUP"] == "Engine":
+            return 0.0 if opt["OPTION_ID"] == "21" else 1e6
+        return opt["COST_USD"]
+
+    result = main.solve_linked_rules(domains, loss, rules_by_option)
+    assert result["feasible"] and result["exhaustive"]
+    picked = {opt["COMPONENT_GROUP"]: opt["OPTION_ID"] for opt in result["picks"].values()}
+    assert picked == {"Cab Type": "1", "Engine": "21", "Turbocharger": "11"}
+    assert result["loss"] == 4000
+
+
+def test_solve_linked_rules_infeasible_and_node_limit(catalog, rules_by_option):
+    # Only the 605HP engine and the single turbo it rejects
+    domains = {
+        "Engine|Core|Engine": [catalog["byId"]["21"]],
+        "Engine|Turbo|Turbocharger": [catalog["byId"]["10"]],
+    }
+    result = main.solve_linked_rules(domains, lambda key, opt: 0.0, rules_by_option)
+    assert not result["feasible"] and result["exhaustive"]
+
+    limited = main.solve_linked_rules(domains, lambda key, opt: 0.0, rules_by_option, max_nodes=0)
+    assert not limited["feasible"] and not limited["exhaustive"]
+
+
+
+def test_solve_fix_plan(catalog, rules_by_option):
+    by_id = catalog["byId"]
+    valid = {main.group_key(by_id[o]): by_id[o] for o in ("1", "10", "20")}
+    assert main.solve_fix_plan(catalog, valid, rules_by_option)["status"] == "valid"
+
+    broken = {main.group_key(by_id[o]): by_id[o] for o in ("1", "10", "21")}
+    plan = main.solve_fix_plan(catalog, broken, rules_by_option)
+    assert plan["status"] == "solved"
+    assert [(old["OPTION_ID"], new["OPTION_ID"]) for old, new in plan["changes"]] == [("10", "11")]
+    assert plan["costDelta"] == 4000
+
+
+
+def test_solve_fix_plan_grows_to_the_triggering_group(catalog, rules_by_option):
+    by_id = catalog["byId"]
+    # No turbo delivers 60 PSI, so the only fix is to give up the 605HP engine
+    strict = {"21": [{**rules_by_option["21"][0], "MIN_VALUE": 60}]}
+    broken = {main.group_key(by_id[o]): by_id[o] for o in ("1", "10", "21")}
+    plan = main.solve_fix_plan(catalog, broken, strict)
+    assert plan["status"] == "solved" and plan["iterations"] > 1
+    assert [(old["OPTION_ID"], new["OPTION_ID"]) for old, new in plan["changes"]] == [("21", "20")]
+    assert plan["costDelta"] == -9000
@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+
+import main
+
+
+class Blocked:
+    """A call that runs until released, counting its executions"""
+
+    def __init__(self, result=None, error=None):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.executions = 0
+        self.result, self.error = result, error
+
+    def __call__(self):
+        self.executions += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def in_thread(fn):
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = fn()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+
+def wait_for_waiters(flight, key, count):
+    deadline = time.time() + 5
+    while flight.calls[key]["waiters"] < count:
+        assert time.time() < deadline
+        time.sleep(0.001)
+
+
+def test_followers_share_one_execution():
+    flight, call = main.SingleFlight(), Blocked(result={"rows": [1, 2]})
+    leader, leader_out = in_thread(lambda: flight.do("k", call))
+    call.started.wait(5)
+    follower, follower_out = in_thread(lambda: flight.do("k", call))
+    wait_for_waiters(flight, "k", 1)
+    call.release.set()
+    leader.join(5), follower.join(5)
+    assert call.executions == 1
+    assert follower_out["result"] == leader_out["result"]
+    # Followers get their own copy
+    assert follower_out["result"] is not leader_out["result"]
+    assert flight.stats()["collapsed"] == 1
+
+
+def test_write_starts_a_new_generation():
+    flight, call = main.SingleFlight(), Blocked(result=1)
+    leader, _ = in_thread(lambda: flight.do("k", call))
+    call.started.wait(5)
+    flight.wrote()
+    # Started after the write, so it must not join the pre-write flight
+    later, later_out = in_thread(lambda: flight.do("k", call))
+    deadline = time.time() + 5
+    while call.executions < 2:
+        assert time.time() < deadline
+        time.sleep(0.001)
+    call.release.set()
+    leader.join(5), later.join(5)
+    assert later_out["result"] == 1
+    assert flight.stats()["collapsed"] == 0
+    assert flight.stats()["writeGeneration"] == 1
+
+
+def test_followers_rerun_when_the_leader_is_cancelled():
+    flight = main.SingleFlight()
+    cancelled = Blocked(error=main.QueryCancelled("owner cancelled"))
+    leader, leader_out = in_thread(lambda: flight.do("k", cancelled))
+    cancelled.started.wait(5)
+    follower, follower_out = in_thread(lambda: flight.do("k", lambda: "own result"))
+    wait_for_waiters(flight, "k", 1)
+    cancelled.release.set()
+    leader.join(5), follower.join(5)
+    assert isinstance(leader_out["error"], main.QueryCancelled)
+    assert follower_out["result"] == "own result"
+
+
+def test_followers_see_the_leaders_error():
+    flight, call = main.SingleFlight(), Blocked(error=RuntimeError("warehouse down"))
+    leader, _ = in_thread(lambda: flight.do("k", call))
+    call.started.wait(5)
+    follower, follower_out = in_thread(lambda: flight.do("k", call))
+    wait_for_waiters(flight, "k", 1)
+    call.release.set()
+    leader.join(5), follower.join(5)
+    assert str(follower_out["error"]) == "warehouse down"
+    assert call.executions == 1
+
+
+def test_flight_key_includes_statement_class():
+    token = main._query_class.set("chat")
+    try:
+        chat_key = main.sql_flight_key("query", "SELECT 1")
+    finally:
+        main._query_class.reset(token)
+    assert chat_key != main.sql_flight_key("query", "SELECT 1")
+
+
+def test_writes_bump_the_generation(monkeypatch):
+    flight = main.SingleFlight()
+    monkeypatch.setattr(main, "_single_flight", flight)
+
+    def failing(sql):
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        main.run_write(failing, "DELETE FROM T")
+    main.run_write(lambda sql: [], "DELETE FROM T")
+    # Failed writes count too: they may have partially applied
+    assert flight.generation == 2
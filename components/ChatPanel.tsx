@@ -155,7 +155,8 @@ export function ChatPanel({ modelId, modelInfo, selectedOptions, onApplyOptions,
           message: userMessage,
           modelId,
           modelInfo,
-          selectedOptions
+          selectedOptions,
+          sessionId
         })
       });
 
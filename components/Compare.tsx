@@ -2,7 +2,7 @@
 
 import { useState } from "react";
 import type { Model, SavedConfig } from "@/app/page";
-import { formatCurrency, formatWeight, cn } from "@/lib/utils";
+import { formatCurrency, formatWeight, cn, fetchFullConfig } from "@/lib/utils";
 import { Truck, Upload, X, ArrowLeftRight, FileText, ChevronDown, ChevronUp, Edit2, Trash2 } from "lucide-react";
 import { ConfigurationReport } from "./ConfigurationReport";
 
@@ -11,9 +11,11 @@ interface CompareProps {
   models: Model[];
   onLoadConfig: (config: SavedConfig) => void;
   onUpdateConfig?: () => Promise<void>;
+  hasMoreConfigs?: boolean;
+  onLoadMoreConfigs?: () => Promise<void>;
 }
 
-export function Compare({ savedConfigs, models, onLoadConfig, onUpdateConfig }: CompareProps) {
+export function Compare({ savedConfigs, models, onLoadConfig, onUpdateConfig, hasMoreConfigs, onLoadMoreConfigs }: CompareProps) {
   const [leftConfig, setLeftConfig] = useState<SavedConfig | null>(null);
   const [rightConfig, setRightConfig] = useState<SavedConfig | null>(null);
   const [showSelector, setShowSelector] = useState<"left" | "right" | null>(null);
@@ -22,6 +24,21 @@ export function Compare({ savedConfigs, models, onLoadConfig, onUpdateConfig }:
   const [editConfig, setEditConfig] = useState<SavedConfig | null>(null);
   const [deleteConfig, setDeleteConfig] = useState<SavedConfig | null>(null);
 
+  async function handleSelectConfig(side: "left" | "right", config: SavedConfig) {
+    setShowSelector(null);
+    try {
+      // The list holds summaries; the comparison and report need the full option set
+      const full = await fetchFullConfig(config);
+      if (side === "left") {
+        setLeftConfig(full);
+      } else {
+        setRightConfig(full);
+      }
+    } catch (error) {
+      console.error('Error loading config:', error);
+    }
+  }
+
   async function handleDeleteConfig(configId: string) {
     try {
       await fetch(`/api/configs?configId=${encodeURIComponent(configId)}`, {
@@ -292,12 +309,7 @@ export function Compare({ savedConfigs, models, onLoadConfig, onUpdateConfig }:
                     <button
                       onClick={() => {
                         if (!isOtherSide) {
-                          if (showSelector === "left") {
-                            setLeftConfig(config);
-                          } else {
-                            setRightConfig(config);
-                          }
-                          setShowSelector(null);
+                          handleSelectConfig(showSelector, config);
                         }
                       }}
                       disabled={isOtherSide}
@@ -341,6 +353,15 @@ export function Compare({ savedConfigs, models, onLoadConfig, onUpdateConfig }:
                 );
               })}
             </div>
+
+            {hasMoreConfigs && (
+              <button
+                onClick={() => onLoadMoreConfigs?.()}
+                className="w-full mt-4 py-2 border rounded-lg font-medium hover:bg-muted transition-colors text-sm"
+              >
+                Load more
+              </button>
+            )}
           </div>
         </div>
       )}
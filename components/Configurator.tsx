@@ -1461,6 +1461,7 @@ function ChatPanel({ model, selectedOptions, allOptions, sessionId, onClose, onA
           modelId: model.MODEL_ID,
           modelInfo,
           selectedOptions: optionDetails,
+          sessionId,
         }),
       });
       const data = await res.json();
@@ -1887,7 +1888,8 @@ function SaveModal({
           optimizationHistory: effectiveOptHistory,
           manualChanges,
           costDelta,
-          weightDelta
+          weightDelta,
+          sessionId
         })
       });
 
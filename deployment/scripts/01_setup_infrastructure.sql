@@ -48,8 +48,11 @@ SHOW IMAGE REPOSITORIES IN SCHEMA ${DATABASE}.${SCHEMA};
 -- =============================================================================
 -- 5. CREATE INTERNAL STAGES
 -- =============================================================================
+-- PARSE_DOCUMENT needs SNOWFLAKE_SSE. IF NOT EXISTS leaves an existing stage as it
+-- was; run migrate_docs_stage_sse.sql for stages created without it.
 CREATE STAGE IF NOT EXISTS ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE
     DIRECTORY = (ENABLE = TRUE)
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
     COMMENT = 'Stage for engineering specification PDFs';
 
 CREATE STAGE IF NOT EXISTS ${DATABASE}.${SCHEMA}.SEMANTIC_MODELS
@@ -95,9 +95,13 @@ CREATE TABLE IF NOT EXISTS ENGINEERING_DOCS_CHUNKED (
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
     LINKED_PARTS VARIANT,
     CACHED_REQUIREMENTS VARIANT,
+    CONTENT_HASH VARCHAR(64),
     PRIMARY KEY (CHUNK_ID)
 );
 
+-- Existing deployments: SHA-256 of the uploaded file, used to deduplicate re-uploads
+ALTER TABLE ENGINEERING_DOCS_CHUNKED ADD COLUMN IF NOT EXISTS CONTENT_HASH VARCHAR(64);
+
 ALTER TABLE ENGINEERING_DOCS_CHUNKED SET CHANGE_TRACKING = TRUE;
 
 COMMENT ON TABLE ENGINEERING_DOCS_CHUNKED IS 'Chunked engineering documents for semantic search';
@@ -128,11 +132,44 @@ CREATE TABLE IF NOT EXISTS SAVED_CONFIGS (
     TOTAL_WEIGHT NUMBER(12,2) DEFAULT 0,
     SELECTIONS VARIANT NOT NULL,
     NOTES VARCHAR(4000),
+    CONFIG_FINGERPRINT VARCHAR(64),
     PRIMARY KEY (CONFIG_ID)
 );
 
+-- Existing deployments: order-independent hash of the model and its distinct option ids
+ALTER TABLE SAVED_CONFIGS ADD COLUMN IF NOT EXISTS CONFIG_FINGERPRINT VARCHAR(64);
+
+-- Recompute fingerprints stored while they still included catalog and rule versions
+-- (must match saved_config_fingerprint() in backend/main.py). Option ids are cast to
+-- VARCHAR before deduplicating and sorting, as Python compares them as strings, and
+-- rows that already hold the right fingerprint are left alone so re-runs rewrite nothing.
+UPDATE SAVED_CONFIGS
+SET CONFIG_FINGERPRINT = SHA2(MODEL_ID || ':' || ARRAY_TO_STRING(ARRAY_SORT(ARRAY_DISTINCT(
+        TRANSFORM(SELECTIONS:selectedOptions::ARRAY, id VARIANT -> id::VARCHAR))), ','), 256)
+WHERE SELECTIONS:selectedOptions IS NOT NULL
+  AND CONFIG_FINGERPRINT IS DISTINCT FROM SHA2(MODEL_ID || ':' || ARRAY_TO_STRING(ARRAY_SORT(ARRAY_DISTINCT(
+        TRANSFORM(SELECTIONS:selectedOptions::ARRAY, id VARIANT -> id::VARCHAR))), ','), 256);
+
 COMMENT ON TABLE SAVED_CONFIGS IS 'User-saved truck configurations';
 
+-- =============================================================================
+-- 8. INGESTION_JOBS - Background Document Ingestion Status
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS INGESTION_JOBS (
+    JOB_ID VARCHAR(100) NOT NULL,
+    DOC_ID VARCHAR(100),
+    FILENAME VARCHAR(500),
+    STATUS VARCHAR(20) NOT NULL,
+    LAST_EVENT VARIANT,
+    RESULT VARIANT,
+    ERROR VARCHAR(4000),
+    CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    UPDATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    PRIMARY KEY (JOB_ID)
+);
+
+COMMENT ON TABLE INGESTION_JOBS IS 'Status of background engineering document ingestion jobs';
+
 -- =============================================================================
 -- VERIFICATION QUERIES
 -- =============================================================================
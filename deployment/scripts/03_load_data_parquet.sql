@@ -0,0 +1,66 @@
+-- =============================================================================
+-- Digital Twin Truck Configurator - Data Load Script (Parquet)
+-- =============================================================================
+-- Part 3 of 4, for data exported with generate_data_sql.py --format parquet.
+-- Same PUT + COPY INTO flow as 03_load_data.sql; setup.sh uses this file when
+-- deployment/data/model_data.parquet exists.
+-- Customize ${DATABASE}, ${SCHEMA}, ${WAREHOUSE} and ${DATA_DIR} before running
+-- =============================================================================
+
+USE DATABASE ${DATABASE};
+USE SCHEMA ${SCHEMA};
+USE WAREHOUSE ${WAREHOUSE};
+
+CREATE TEMPORARY STAGE IF NOT EXISTS CATALOG_LOAD_STAGE;
+
+CREATE TEMPORARY FILE FORMAT IF NOT EXISTS CATALOG_PARQUET
+    TYPE = PARQUET;
+
+-- Parquet is already compressed internally
+PUT 'file://${DATA_DIR}/*_data.parquet' @CATALOG_LOAD_STAGE AUTO_COMPRESS = FALSE OVERWRITE = TRUE PARALLEL = 8;
+
+-- =============================================================================
+-- 1. MODEL_TBL
+-- =============================================================================
+COPY INTO MODEL_TBL (MODEL_ID, MODEL_NM, TRUCK_DESCRIPTION, BASE_MSRP, BASE_WEIGHT_LBS, MAX_PAYLOAD_LBS, MAX_TOWING_LBS, SLEEPER_AVAILABLE, MODEL_TIER)
+FROM (
+    SELECT $1:MODEL_ID, $1:MODEL_NM, $1:TRUCK_DESCRIPTION, $1:BASE_MSRP, $1:BASE_WEIGHT_LBS,
+           $1:MAX_PAYLOAD_LBS, $1:MAX_TOWING_LBS, $1:SLEEPER_AVAILABLE, $1:MODEL_TIER
+    FROM @CATALOG_LOAD_STAGE
+)
+PATTERN = '.*model_data[.]parquet'
+FILE_FORMAT = (FORMAT_NAME = 'CATALOG_PARQUET')
+ON_ERROR = ABORT_STATEMENT;
+
+-- =============================================================================
+-- 2. BOM_TBL (SPECS parsed from its JSON text)
+-- =============================================================================
+COPY INTO BOM_TBL (OPTION_ID, SYSTEM_NM, SUBSYSTEM_NM, COMPONENT_GROUP, OPTION_NM, COST_USD, WEIGHT_LBS, SOURCE_COUNTRY, PERFORMANCE_CATEGORY, PERFORMANCE_SCORE, DESCRIPTION, OPTION_TIER, SPECS)
+FROM (
+    SELECT $1:OPTION_ID, $1:SYSTEM_NM, $1:SUBSYSTEM_NM, $1:COMPONENT_GROUP, $1:OPTION_NM,
+           $1:COST_USD, $1:WEIGHT_LBS, $1:SOURCE_COUNTRY, $1:PERFORMANCE_CATEGORY,
+           $1:PERFORMANCE_SCORE, $1:DESCRIPTION, $1:OPTION_TIER, PARSE_JSON($1:SPECS::VARCHAR)
+    FROM @CATALOG_LOAD_STAGE
+)
+PATTERN = '.*bom_data[.]parquet'
+FILE_FORMAT = (FORMAT_NAME = 'CATALOG_PARQUET')
+ON_ERROR = ABORT_STATEMENT;
+
+-- =============================================================================
+-- 3. TRUCK_OPTIONS
+-- =============================================================================
+COPY INTO TRUCK_OPTIONS (MODEL_ID, OPTION_ID, IS_DEFAULT)
+FROM (
+    SELECT $1:MODEL_ID, $1:OPTION_ID, $1:IS_DEFAULT
+    FROM @CATALOG_LOAD_STAGE
+)
+PATTERN = '.*truck_options_data[.]parquet'
+FILE_FORMAT = (FORMAT_NAME = 'CATALOG_PARQUET')
+ON_ERROR = ABORT_STATEMENT;
+
+-- =============================================================================
+-- Data load complete!
+-- =============================================================================
+SELECT 'MODEL_TBL' AS TABLE_NAME, COUNT(*) AS ROW_COUNT FROM MODEL_TBL
+UNION ALL SELECT 'BOM_TBL', COUNT(*) FROM BOM_TBL
+UNION ALL SELECT 'TRUCK_OPTIONS', COUNT(*) FROM TRUCK_OPTIONS;
@@ -1,126 +1,163 @@
 #!/usr/bin/env python3
-"""Generate complete 03_load_data.sql from Snowflake data"""
+"""Export MODEL_TBL, BOM_TBL and TRUCK_OPTIONS to data files for 03_load_data.sql.
+
+Each table is streamed with fetchmany() (CSV) or the connector's Arrow batches (Parquet)
+straight to deployment/data/<name>.<format>, so memory stays flat however large the
+catalog is. Tables export concurrently, one connection each. The loader PUTs the files
+to a stage and COPYs them in, instead of replaying giant INSERT ... VALUES statements.
+
+Usage:
+    python generate_data_sql.py [--connection NAME] [--database BOM] [--schema BOM4]
+                                [--format csv|parquet] [--output-dir DIR] [--batch-rows N]
+"""
+import argparse
+import csv
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import snowflake.connector
 
-conn = snowflake.connector.connect(
-    connection_name=os.getenv("SNOWFLAKE_CONNECTION_NAME") or "awsbarbarian_CoCo"
-)
-
-output_path = "/Users/jdrew/coco_projects/BOM/truck-configurator/deployment/scripts/03_load_data.sql"
-
-header = '''-- =============================================================================
--- Digital Twin Truck Configurator - Data Load Script
--- =============================================================================
--- Part 3 of 4: Loads BOM_TBL, MODEL_TBL, and TRUCK_OPTIONS with SPECS included
--- SPECS are included in the INSERT, not updated separately (fast deployment)
--- Customize ${DATABASE} and ${SCHEMA} before running
--- =============================================================================
-
-USE DATABASE ${DATABASE};
-USE SCHEMA ${SCHEMA};
-USE WAREHOUSE ${WAREHOUSE};
-
--- =============================================================================
--- 1. INSERT MODEL_TBL (5 truck models)
--- =============================================================================
-'''
-
-cursor = conn.cursor()
-
-# Get MODEL data
-cursor.execute("""
-    SELECT MODEL_ID, MODEL_NM, TRUCK_DESCRIPTION, BASE_MSRP, BASE_WEIGHT_LBS, MAX_PAYLOAD_LBS, MAX_TOWING_LBS, SLEEPER_AVAILABLE, MODEL_TIER
-    FROM BOM.BOM4.MODEL_TBL
-    ORDER BY MODEL_ID
-""")
-models = cursor.fetchall()
-
-model_inserts = []
-for m in models:
-    model_id, model_nm, desc, msrp, weight, payload, towing, sleeper, tier = m
-    desc_escaped = desc.replace("'", "''") if desc else ''
-    sleeper_str = 'true' if sleeper else 'false'
-    model_inserts.append(
-        f"('{model_id}', '{model_nm}', '{desc_escaped}', {msrp}, {weight}, {payload}, {towing}, {sleeper_str}, '{tier}')"
-    )
-
-model_values = ',\n'.join(model_inserts)
-model_section = f'''INSERT INTO MODEL_TBL (MODEL_ID, MODEL_NM, TRUCK_DESCRIPTION, BASE_MSRP, BASE_WEIGHT_LBS, MAX_PAYLOAD_LBS, MAX_TOWING_LBS, SLEEPER_AVAILABLE, MODEL_TIER)
-VALUES
-{model_values};
-
--- =============================================================================
--- 2. INSERT BOM_TBL (253 options with SPECS included)
--- =============================================================================
-'''
-
-# Get BOM data
-cursor.execute("""
-    SELECT OPTION_ID, SYSTEM_NM, SUBSYSTEM_NM, COMPONENT_GROUP, OPTION_NM, COST_USD, WEIGHT_LBS, 
-           SOURCE_COUNTRY, PERFORMANCE_CATEGORY, PERFORMANCE_SCORE, DESCRIPTION, OPTION_TIER, SPECS::VARCHAR
-    FROM BOM.BOM4.BOM_TBL
-    ORDER BY CAST(OPTION_ID AS INT)
-""")
-bom_rows = cursor.fetchall()
-
-bom_inserts = []
-for row in bom_rows:
-    option_id, sys, subsys, cg, name, cost, weight, country, perf_cat, perf_score, desc, tier, specs = row
-    name_escaped = name.replace("'", "''") if name else ''
-    desc_escaped = desc.replace("'", "''") if desc else ''
-    specs_escaped = specs.replace("'", "''") if specs else 'null'
-    specs_part = f"PARSE_JSON('{specs_escaped}')" if specs else 'NULL'
-    bom_inserts.append(
-        f"('{option_id}', '{sys}', '{subsys}', '{cg}', '{name_escaped}', {cost:.2f}, {weight:.2f}, '{country}', '{perf_cat}', {perf_score}, '{desc_escaped}', '{tier}', {specs_part})"
-    )
-
-bom_values = ',\n'.join(bom_inserts)
-bom_section = f'''INSERT INTO BOM_TBL (OPTION_ID, SYSTEM_NM, SUBSYSTEM_NM, COMPONENT_GROUP, OPTION_NM, COST_USD, WEIGHT_LBS, SOURCE_COUNTRY, PERFORMANCE_CATEGORY, PERFORMANCE_SCORE, DESCRIPTION, OPTION_TIER, SPECS)
-VALUES
-{bom_values};
-
--- =============================================================================
--- 3. INSERT TRUCK_OPTIONS (868 model-option mappings)
--- =============================================================================
-'''
-
-# Get TRUCK_OPTIONS data
-cursor.execute("""
-    SELECT MODEL_ID, OPTION_ID, IS_DEFAULT
-    FROM BOM.BOM4.TRUCK_OPTIONS
-    ORDER BY MODEL_ID, CAST(OPTION_ID AS INT)
-""")
-truck_opts = cursor.fetchall()
-
-truck_inserts = []
-for row in truck_opts:
-    model_id, option_id, is_default = row
-    default_str = 'true' if is_default else 'false'
-    truck_inserts.append(f"('{model_id}', '{option_id}', {default_str})")
-
-truck_values = ',\n'.join(truck_inserts)
-truck_section = f'''INSERT INTO TRUCK_OPTIONS (MODEL_ID, OPTION_ID, IS_DEFAULT)
-VALUES
-{truck_values};
-
--- =============================================================================
--- Data load complete!
--- Total: 5 models, 253 BOM options, 868 truck-option mappings
--- =============================================================================
-'''
-
-# Write the file
-with open(output_path, 'w') as f:
-    f.write(header)
-    f.write(model_section)
-    f.write(bom_section)
-    f.write(truck_section)
-
-print(f"Generated {output_path}")
-print(f"  - {len(models)} MODEL rows")
-print(f"  - {len(bom_rows)} BOM rows")
-print(f"  - {len(truck_opts)} TRUCK_OPTIONS rows")
-
-cursor.close()
-conn.close()
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# file name -> (table, select list, order by); column names match the target tables
+TABLES = {
+    "model_data": (
+        "MODEL_TBL",
+        "MODEL_ID, MODEL_NM, TRUCK_DESCRIPTION, BASE_MSRP, BASE_WEIGHT_LBS, MAX_PAYLOAD_LBS, "
+        "MAX_TOWING_LBS, SLEEPER_AVAILABLE, MODEL_TIER",
+        "MODEL_ID",
+    ),
+    "bom_data": (
+        "BOM_TBL",
+        "OPTION_ID, SYSTEM_NM, SUBSYSTEM_NM, COMPONENT_GROUP, OPTION_NM, COST_USD, WEIGHT_LBS, "
+        "SOURCE_COUNTRY, PERFORMANCE_CATEGORY, PERFORMANCE_SCORE, DESCRIPTION, OPTION_TIER, SPECS::VARCHAR AS SPECS",
+        "CAST(OPTION_ID AS INT)",
+    ),
+    "truck_options_data": (
+        "TRUCK_OPTIONS",
+        "MODEL_ID, OPTION_ID, IS_DEFAULT",
+        "MODEL_ID, CAST(OPTION_ID AS INT)",
+    ),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--connection", default=os.getenv("SNOWFLAKE_CONNECTION_NAME"),
+                        help="Snowflake CLI connection name (default: $SNOWFLAKE_CONNECTION_NAME)")
+    parser.add_argument("--database", default=os.getenv("SOURCE_DATABASE", "BOM"))
+    parser.add_argument("--schema", default=os.getenv("SOURCE_SCHEMA", "BOM4"))
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--batch-rows", type=int, default=10000)
+    args = parser.parse_args()
+    if not args.connection:
+        parser.error("--connection or SNOWFLAKE_CONNECTION_NAME is required")
+    return args
+
+
+def csv_value(value):
+    # Booleans as True/False and NULL as an empty field, which the loader reads back as NULL
+    if value is None:
+        return ""
+    return str(value)
+
+
+def write_csv(cursor, path: Path, batch_rows: int) -> int:
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([col[0] for col in cursor.description])
+        while True:
+            batch = cursor.fetchmany(batch_rows)
+            if not batch:
+                return rows
+            writer.writerows([csv_value(v) for v in row] for row in batch)
+            rows += len(batch)
+
+
+def write_parquet(cursor, path: Path) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    schema = None
+    try:
+        for table in cursor.fetch_arrow_batches():
+            if writer is None:
+                # Snowflake picks the integer width per result chunk; widen so every chunk fits
+                schema = pa.schema([
+                    field.with_type(pa.int64()) if pa.types.is_integer(field.type) else field
+                    for field in table.schema
+                ])
+                writer = pq.ParquetWriter(str(path), schema)
+            writer.write_table(table.cast(schema))
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def export_table(args, name: str) -> dict:
+    table, columns, order_by = TABLES[name]
+    path = args.output_dir / f"{name}.{args.format}"
+    started = time.time()
+    path.unlink(missing_ok=True)
+    conn = snowflake.connector.connect(connection_name=args.connection)
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = args.batch_rows
+        cursor.execute(f"SELECT {columns} FROM {args.database}.{args.schema}.{table} ORDER BY {order_by}")
+        query_seconds = time.time() - started
+        if args.format == "parquet":
+            rows = write_parquet(cursor, path)
+        else:
+            rows = write_csv(cursor, path, args.batch_rows)
+        cursor.close()
+    finally:
+        conn.close()
+    if rows == 0 and path.exists():
+        # Nothing to load: the loader's COPY simply finds no file for this table
+        path.unlink()
+    return {
+        "table": table,
+        "path": path,
+        "rows": rows,
+        "bytes": path.stat().st_size if path.exists() else 0,
+        "querySeconds": query_seconds,
+        "seconds": time.time() - started,
+    }
+
+
+def main():
+    args = parse_args()
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    started = time.time()
+    print(f"Exporting {args.database}.{args.schema} as {args.format} to {args.output_dir}")
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(TABLES)) as pool:
+        futures = {name: pool.submit(export_table, args, name) for name in TABLES}
+        for name, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                failed = True
+                print(f"  {name}: FAILED - {e}")
+                continue
+            print(f"  {result['table']:<14} {result['rows']:>9,} rows  {result['bytes'] / 1024:>9,.1f} KiB  "
+                  f"query {result['querySeconds']:.2f}s  total {result['seconds']:.2f}s  -> {result['path'].name}")
+
+    print(f"Done in {time.time() - started:.2f}s")
+    if args.format == "parquet":
+        print("Load with 03_load_data_parquet.sql (setup.sh picks it when model_data.parquet exists)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+-- =============================================================================
+-- Digital Twin Truck Configurator - Docs Stage Encryption Migration
+-- =============================================================================
+-- For deployments whose ENGINEERING_DOCS_STAGE was created without
+-- ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE'). PARSE_DOCUMENT only reads SSE stages,
+-- and a stage's encryption type cannot be altered in place, so the stage is
+-- recreated and its files copied across. CREATE STAGE IF NOT EXISTS in
+-- 01_setup_infrastructure.sql and setup.sh leaves an existing stage untouched.
+--
+-- Stored DOC_PATH values keep working: the new stage takes over the old name.
+-- Stop uploads (or scale the service to zero) while this runs.
+-- Customize ${DATABASE} and ${SCHEMA} before running
+-- =============================================================================
+
+USE ROLE ACCOUNTADMIN;
+USE DATABASE ${DATABASE};
+USE SCHEMA ${SCHEMA};
+
+-- 1. Check the current encryption: the ENCRYPTION row shows TYPE. If it is
+--    already SNOWFLAKE_SSE there is nothing to do.
+DESCRIBE STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE;
+
+-- 2. Create the SSE stage and copy every document into it
+CREATE STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_SSE
+    DIRECTORY = (ENABLE = TRUE)
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+    COMMENT = 'Stage for engineering specification PDFs';
+
+COPY FILES INTO @${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_SSE
+    FROM @${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE;
+
+-- 3. Swap names so the SSE stage answers to ENGINEERING_DOCS_STAGE
+ALTER STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE RENAME TO ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_PRE_SSE;
+ALTER STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_SSE RENAME TO ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE;
+ALTER STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE REFRESH;
+
+-- 4. Verify: both listings should have the same files
+LIST @${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE;
+LIST @${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_PRE_SSE;
+
+-- 5. Once verified, drop the old stage
+-- DROP STAGE ${DATABASE}.${SCHEMA}.ENGINEERING_DOCS_STAGE_PRE_SSE;
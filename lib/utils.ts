@@ -1,5 +1,6 @@
 import { clsx, type ClassValue } from "clsx";
 import { twMerge } from "tailwind-merge";
+import type { SavedConfig } from "@/app/page";
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
@@ -17,3 +18,11 @@ export function formatCurrency(value: number): string {
 export function formatWeight(value: number): string {
   return new Intl.NumberFormat("en-US").format(value) + " lbs";
 }
+
+// The saved-configs list is fetched as summaries; options are loaded when a config is opened
+export async function fetchFullConfig(config: SavedConfig): Promise<SavedConfig> {
+  if (config.CONFIG_OPTIONS) return config;
+  const res = await fetch(`/api/configs/${encodeURIComponent(config.CONFIG_ID)}`);
+  if (!res.ok) throw new Error(`Failed to load config ${config.CONFIG_ID}: ${res.status}`);
+  return res.json();
+}
@@ -30,8 +30,14 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Load full data from SQL file (includes BOM_TBL, MODEL_TBL, TRUCK_OPTIONS)
 echo "Loading all demo data (BOM_TBL, MODEL_TBL, TRUCK_OPTIONS)..."
-if [[ -f "$SCRIPT_DIR/deployment/scripts/03_load_data.sql" ]]; then
-    snow sql -f "$SCRIPT_DIR/deployment/scripts/03_load_data.sql" --connection "$CONNECTION_NAME"
+LOAD_SQL="$SCRIPT_DIR/deployment/scripts/03_load_data.sql"
+if [[ -f "$SCRIPT_DIR/deployment/data/model_data.parquet" ]]; then
+    LOAD_SQL="$SCRIPT_DIR/deployment/scripts/03_load_data_parquet.sql"
+fi
+if [[ -f "$LOAD_SQL" ]]; then
+    sed "s/\${DATABASE}/$DATABASE/g; s/\${SCHEMA}/$SCHEMA/g; s/\${WAREHOUSE}/$WAREHOUSE/g; s|\${DATA_DIR}|$SCRIPT_DIR/deployment/data|g" \
+        "$LOAD_SQL" > /tmp/load_data_processed.sql
+    snow sql -f /tmp/load_data_processed.sql --connection "$CONNECTION_NAME"
     echo "Full data loaded."
 else
     echo "WARNING: 03_load_data.sql not found, loading minimal data..."
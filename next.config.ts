@@ -21,6 +21,10 @@ const nextConfig: NextConfig = {
         source: "/api/configs",
         destination: `${backendUrl}/api/configs`,
       },
+      {
+        source: "/api/configs/:configId",
+        destination: `${backendUrl}/api/configs/:configId`,
+      },
       {
         source: "/api/chat",
         destination: `${backendUrl}/api/chat`,
@@ -305,11 +305,16 @@ echo ""
 # ============ STEP 6: Load Data ============
 echo "STEP 6: Load Data"
 echo "----------------"
-if [[ -f "$SCRIPT_DIR/deployment/scripts/03_load_data.sql" ]]; then
-    echo "Loading demo data (BOM_TBL, MODEL_TBL, TRUCK_OPTIONS)..."
+# Parquet exports (generate_data_sql.py --format parquet) take precedence over the shipped CSVs
+LOAD_SQL="$SCRIPT_DIR/deployment/scripts/03_load_data.sql"
+if [[ -f "$SCRIPT_DIR/deployment/data/model_data.parquet" ]]; then
+    LOAD_SQL="$SCRIPT_DIR/deployment/scripts/03_load_data_parquet.sql"
+fi
+if [[ -f "$LOAD_SQL" ]]; then
+    echo "Loading demo data (BOM_TBL, MODEL_TBL, TRUCK_OPTIONS) via stage PUT + COPY INTO..."
     # Process SQL file - replace placeholders with actual values
-    sed "s/\${DATABASE}/$DATABASE/g; s/\${SCHEMA}/$SCHEMA/g; s/\${WAREHOUSE}/$WAREHOUSE/g" \
-        "$SCRIPT_DIR/deployment/scripts/03_load_data.sql" > /tmp/load_data_processed.sql
+    sed "s/\${DATABASE}/$DATABASE/g; s/\${SCHEMA}/$SCHEMA/g; s/\${WAREHOUSE}/$WAREHOUSE/g; s|\${DATA_DIR}|$SCRIPT_DIR/deployment/data|g" \
+        "$LOAD_SQL" > /tmp/load_data_processed.sql
     snow sql -f /tmp/load_data_processed.sql --connection "$CONNECTION_NAME"
     echo "Data loaded."
 else
@@ -399,6 +404,12 @@ REPO_URL=$(snow spcs image-repository url $IMAGE_REPO \
 
 echo "Repository URL: $REPO_URL"
 
+# Catalog snapshot the backend memory-maps at startup (COPY backend/ ships it in the image);
+# without one the container still starts, it just waits for Snowflake before serving the catalog
+echo "Building catalog snapshot..."
+python3 backend/catalog_snapshot.py --connection "$CONNECTION_NAME" --database "$DATABASE" --schema "$SCHEMA" \
+    || echo "WARNING: catalog snapshot build failed (needs pyarrow and snowflake-connector-python); continuing without it"
+
 # Build image
 echo "Building Docker image (this may take a few minutes)..."
 docker build --platform linux/amd64 -t truck-configurator:latest .
@@ -433,12 +444,19 @@ spec:
       SNOWFLAKE_DATABASE: $DATABASE
       SNOWFLAKE_SCHEMA: $SCHEMA
       SNOWFLAKE_WAREHOUSE: $WAREHOUSE
+      CONFIG_JOURNAL_PATH: /var/lib/truck-configurator/saved_configs_journal.ndjson
       NODE_ENV: production
+    volumeMounts:
+    - name: journal
+      mountPath: /var/lib/truck-configurator
     secrets:
     - snowflakeSecret:
         objectName: $DATABASE.$SCHEMA.SNOWFLAKE_PRIVATE_KEY_SECRET
       secretKeyRef: secret_string
       envVarName: SNOWFLAKE_PRIVATE_KEY
+    readinessProbe:
+      port: 8080
+      path: /api/ready
     resources:
       requests:
         memory: 2G
@@ -450,6 +468,10 @@ spec:
   - name: app
     port: 8080
     public: true
+  volumes:
+  - name: journal
+    source: block
+    size: 1Gi
   networkPolicyConfig:
     allowInternetEgress: true
 \$\$"